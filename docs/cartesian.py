@@ -456,7 +456,7 @@ x = np.linspace(0, 4 * np.pi, 100)
 dy = np.linspace(-1, 1, 5)
 ys = (np.sin(x), np.cos(x))
 state = np.random.RandomState(51423)
-data = state.rand(len(dy) - 1, len(x) - 1)
+data = state.random((len(dy) - 1, len(x) - 1))
 colors = ("coral", "sky blue")
 cmap = uplt.Colormap("grays", right=0.8)
 fig, axs = uplt.subplots(nrows=4, refaspect=(5, 1), figwidth=5.5, sharex=False)
@@ -498,7 +498,7 @@ import numpy as np
 # Create figure
 n = 30
 state = np.random.RandomState(51423)
-data = state.rand(n - 1, n - 1)
+data = state.random((n - 1, n - 1))
 colors = ("coral", "sky blue")
 cmap = uplt.Colormap("grays", right=0.8)
 gs = uplt.GridSpec(nrows=2, ncols=2)
@@ -511,7 +511,7 @@ y = np.linspace(-85, 85, n)
 for i, scale in enumerate(("sine", "mercator")):
     ax = fig.subplot(gs[i, 0])
     ax.plot(x, y, "-", color=colors[i], lw=4)
-    ax.pcolormesh(x, y, data, cmap="grays", cmap_kw={"right": 0.8})
+    ax.pcolormesh(x, y, data, cmap=cmap)
     ax.format(
         yscale=scale,
         title=scale.title() + " scale",
@@ -524,17 +524,17 @@ for i, scale in enumerate(("sine", "mercator")):
 n = 50
 x = np.linspace(0, 1, n)
 y = 3 * np.linspace(0, 1, n)
-data = state.rand(len(y) - 1, len(x) - 1)
+data = state.random((len(y) - 1, len(x) - 1))
 ax = fig.subplot(gs[0, 1])
 title = "Exponential $e^x$ scale"
-ax.pcolormesh(x, y, data, cmap="grays", cmap_kw={"right": 0.8})
+ax.pcolormesh(x, y, data, cmap=cmap)
 ax.plot(x, y, lw=4, color=colors[0])
 ax.format(ymin=0.05, yscale=("exp", np.e), title=title)
 
 # Power scale
 ax = fig.subplot(gs[1, 1])
 title = "Power $x^{0.5}$ scale"
-ax.pcolormesh(x, y, data, cmap="grays", cmap_kw={"right": 0.8})
+ax.pcolormesh(x, y, data, cmap=cmap)
 ax.plot(x, y, lw=4, color=colors[1])
 ax.format(ymin=0.05, yscale=("power", 0.5), title=title)
 
@@ -478,7 +478,7 @@ class CartesianAxes(shared._SharedAxes, plot.PlotAxes):
         caxis._scale = funcscale
         child._update_transScale()
         funcscale.set_default_locators_and_formatters(caxis, only_if_default=True)
-        nlim = list(map(funcscale.functions[1], np.array(olim)))
+        nlim = np.asarray(funcscale.functions[1](np.array(olim)))  # vectorized
         if np.sign(np.diff(olim)) != np.sign(np.diff(nlim)):
             nlim = nlim[::-1]  # if function flips limits, so will set_xlim!
         getattr(child, f"set_{s}lim")(nlim, emit=False)
@@ -825,8 +825,7 @@ class CartesianAxes(shared._SharedAxes, plot.PlotAxes):
             kw = {"rotation": rotation}
             if rotation not in (0, 90, -90):
                 kw["ha"] = "right" if rotation > 0 else "left"
-            for label in axis.get_ticklabels():
-                label.update(kw)
+            labels._update_ticklabels(axis, kw)
             setattr(self, current, rotation)
 
     def _update_spines(self, s, *, loc=None, bounds=None):
@@ -1265,6 +1264,35 @@ class CartesianAxes(shared._SharedAxes, plot.PlotAxes):
                 if margin is not None:
                     self.margins(**{s: margin})
 
+                # Axis locator
+                # NOTE: Install the tickers immediately after the scale and limits
+                # and before any tick properties are touched, so that ticks are
+                # only ever generated with the final locator and formatter.
+                if minorlocator is True or minorlocator is False:  # must test identity
+                    warnings._warn_ultraplot(
+                        f"You passed {s}minorticks={minorlocator}, but this argument "
+                        "is used to specify the tick locations. If you just want to "
+                        f"toggle minor ticks, please use {s}tickminor={minorlocator}."
+                    )
+                    minorlocator = None
+                self._update_locators(
+                    s,
+                    locator,
+                    minorlocator,
+                    tickminor=tickminor,
+                    locator_kw=locator_kw,
+                    minorlocator_kw=minorlocator_kw,
+                )
+
+                # Axis formatter
+                self._update_formatter(
+                    s,
+                    formatter,
+                    formatter_kw=formatter_kw,
+                    tickrange=tickrange,
+                    wraprange=wraprange,
+                )
+
                 # Axis spine settings
                 # NOTE: This sets spine-specific color and linewidth settings. For
                 # non-specific settings _update_background is called in Axes.format()
@@ -1314,32 +1342,6 @@ class CartesianAxes(shared._SharedAxes, plot.PlotAxes):
                 )
                 self._update_labels(s, label, **kw)
 
-                # Axis locator
-                if minorlocator is True or minorlocator is False:  # must test identity
-                    warnings._warn_ultraplot(
-                        f"You passed {s}minorticks={minorlocator}, but this argument "
-                        "is used to specify the tick locations. If you just want to "
-                        f"toggle minor ticks, please use {s}tickminor={minorlocator}."
-                    )
-                    minorlocator = None
-                self._update_locators(
-                    s,
-                    locator,
-                    minorlocator,
-                    tickminor=tickminor,
-                    locator_kw=locator_kw,
-                    minorlocator_kw=minorlocator_kw,
-                )
-
-                # Axis formatter
-                self._update_formatter(
-                    s,
-                    formatter,
-                    formatter_kw=formatter_kw,
-                    tickrange=tickrange,
-                    wraprange=wraprange,
-                )
-
                 # Ensure ticks are within axis bounds
                 self._fix_ticks(s, fixticks=fixticks)
 
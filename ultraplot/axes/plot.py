@@ -485,6 +485,13 @@ Other parameters
 %(plot.inbounds)s
 %(plot.labels_1d)s
 %(plot.guide)s
+collection : bool, default: False
+    Whether to draw the columns of 2D input arrays as a single
+    `~matplotlib.collections.LineCollection` rather than one
+    `~matplotlib.lines.Line2D` per column. This is faster for many lines
+    but is only supported for cartesian axes and does not support markers,
+    format strings, colorbars, per-column labels, or property cycles with
+    properties other than the color, linestyle, and linewidth.
 **kwargs
     Passed to :func:`~matplotlib.axes.Axes.plot`.
 
@@ -2400,9 +2407,15 @@ class PlotAxes(base.Axes):
                 cmap = colors = np.atleast_1d(colors)
                 cmap_kw["listmode"] = "discrete"
         if cmap is not None:
+            # NOTE: Skip the constructor for ultraplot colormap instances passed
+            # without modifications. Otherwise an identical colormap is copied,
+            # re-initialized, and re-registered on every plotting command.
             if plot_lines:
                 cmap_kw["default_luminance"] = constructor.DEFAULT_CYCLE_LUMINANCE
-            cmap = constructor.Colormap(cmap, **cmap_kw)
+            if cmap_kw or not isinstance(
+                cmap, (pcolors.ContinuousColormap, pcolors.DiscreteColormap)
+            ):
+                cmap = constructor.Colormap(cmap, **cmap_kw)
             name = re.sub(r"\A_*(.*?)(?:_r|_s|_copy)*\Z", r"\1", cmap.name.lower())
             if not any(name in opts for opts in pcolors.CMAPS_DIVERGING.items()):
                 autodiverging = False  # avoid auto-truncation of sequential colormaps
@@ -3099,21 +3112,46 @@ class PlotAxes(base.Axes):
 
         return norm, cmap, kwargs
 
-    def _apply_plot(self, *pairs, vert=True, **kwargs):
+    def _apply_plot(self, *pairs, vert=True, collection=False, **kwargs):
         """
         Plot standard lines.
         """
         # Plot the lines
+        # NOTE: With collection=True the cycle properties are applied manually
+        # because matplotlib only cycles them when creating Line2D objects.
         objs, xsides = [], []
         kws = kwargs.copy()
         kws.update(_pop_props(kws, "line"))
         kws, extents = self._inbounds_extent(**kws)
+        cycle_manually = {}
+        if collection:
+            if self._name != "cartesian":
+                raise ValueError(f"{self._name.title()} axes require collection=False.")
+            if kws.get("colorbar"):
+                raise ValueError("Colorbars require collection=False.")
+            keys = [
+                key
+                for key in kws
+                if hasattr(mlines.Line2D, "set_" + key)
+                and not hasattr(mcollections.LineCollection, "set_" + key)
+            ]
+            if keys:
+                raise ValueError(f"Line properties {keys!r} require collection=False.")
+            cycle_manually = {key: key for key in ("color", "linestyle", "linewidth")}
         for xs, ys, fmt in self._iter_arg_pairs(*pairs):
+            if collection and fmt is not None:
+                raise ValueError("Format strings require collection=False.")
             xs, ys, kw = self._parse_1d_args(xs, ys, vert=vert, **kws)
             ys, kw = inputs._dist_reduce(ys, **kw)
             guide_kw = _pop_params(kw, self._update_guide)  # after standardize
+            cols = []
             for _, n, x, y, kw in self._iter_arg_cols(xs, ys, **kw):
-                kw = self._parse_cycle(n, **kw)
+                kw = self._parse_cycle(n, cycle_manually=cycle_manually, **kw)
+                keys = set(self._active_cycle.keys) - set(cycle_manually)
+                if collection and keys:
+                    raise ValueError(
+                        f"Cycle properties {sorted(keys)!r} require collection=False."
+                    )
                 *eb, kw = self._add_error_bars(
                     x, y, vert=vert, default_barstds=True, **kw
                 )  # noqa: E501
@@ -3121,17 +3159,62 @@ class PlotAxes(base.Axes):
                 xsides.append(x)
                 if not vert:
                     x, y = y, x
-                a = [x, y]
-                if fmt is not None:  # x1, y1, fmt1, x2, y2, fm2... style input
-                    a.append(fmt)
-                (obj,) = self._call_native("plot", *a, **kw)
-                self._inbounds_xylim(extents, x, y)
-                objs.append((*eb, *es, obj) if eb or es else obj)
+                if collection:
+                    kw.pop("distribution", None)  # remove stat distributions
+                    cols.append((eb, es, x, y, kw))
+                else:
+                    objs.append(self._add_line(extents, eb, es, x, y, kw, fmt=fmt))
+            if cols:
+                objs.extend(self._add_line_collection(extents, cols))
 
         # Add sticky edges
-        self._fix_sticky_edges(objs, "x" if vert else "y", *xsides, only=mlines.Line2D)
+        cls = mcollections.LineCollection if collection else mlines.Line2D
+        self._fix_sticky_edges(objs, "x" if vert else "y", *xsides, only=cls)
         self._update_guide(objs, **guide_kw)
-        return cbook.silent_list("Line2D", objs)  # always return list
+        return cbook.silent_list(cls.__name__, objs)  # always return list
+
+    def _add_line(self, extents, eb, es, x, y, kw, fmt=None):
+        """
+        Add a single line with the native plotting command.
+        """
+        a = [x, y]
+        if fmt is not None:  # x1, y1, fmt1, x2, y2, fm2... style input
+            a.append(fmt)
+        (obj,) = self._call_native("plot", *a, **kw)
+        self._inbounds_xylim(extents, x, y)
+        return (*eb, *es, obj) if eb or es else obj
+
+    def _add_line_collection(self, extents, cols):
+        """
+        Add a single line collection for the columns.
+        """
+        # NOTE: Only the cycled properties are passed to the collection as sequences.
+        # Remaining properties are shared since _iter_arg_cols only varies labels.
+        keys = ("color", "linestyle", "linewidth", "label")
+        kw = {key: value for key, value in cols[0][-1].items() if key not in keys}
+        for key in keys[:3]:
+            values = [col[-1].get(key, None) for col in cols]
+            if all(value is not None for value in values):
+                kw[key + "s"] = values
+        labels = [col[-1].get("label", None) for col in cols]
+        if len(set(labels)) > 1:
+            warnings._warn_ultraplot(
+                f"Ignoring per-column labels {labels!r} for collection=True."
+            )
+        kw["label"] = labels[0] if len(set(labels)) == 1 else None
+        segs = []
+        for _, _, x, y, _ in cols:  # convert e.g. datetime coordinates
+            self.xaxis.update_units(x)
+            self.yaxis.update_units(y)
+            x, y = self.convert_xunits(x), self.convert_yunits(y)
+            segs.append(np.column_stack((x, y)))
+        obj = mcollections.LineCollection(segs, **kw)
+        self.add_collection(obj)
+        getattr(self, "_request_autoscale_view", self.autoscale_view)()
+        for _, _, x, y, _ in cols:
+            self._inbounds_xylim(extents, x, y)
+        extras = [artist for eb, es, *_ in cols for artist in (*eb, *es)]
+        return [(*extras, obj) if extras else obj]
 
     @docstring._snippet_manager
     def line(self, *args, **kwargs):
@@ -8,7 +8,7 @@ import numpy as np
 
 from ..config import rc
 from ..internals import ic  # noqa: F401
-from ..internals import _pop_kwargs
+from ..internals import _pop_kwargs, labels
 from ..utils import _fontsize_to_pt, _not_none, units
 from ..axes import Axes
 
@@ -183,8 +183,7 @@ class _SharedAxes(object):
 
         # Apply settings that can't be controlled with tick_params
         if kwtext_extra:
-            for lab in obj.get_ticklabels():
-                lab.update(kwtext_extra)
+            labels._update_ticklabels(obj, kwtext_extra)
 
     # Override matplotlib defaults to handle multiple axis sharing
     def sharex(self, other):
@@ -12,7 +12,6 @@ See the :ref:`configuration guide <ug_config>` for details.
 # dependencies and where import order of __init__.py was affecting behavior.
 import logging
 import os
-import re
 import sys
 from collections import namedtuple
 from collections.abc import MutableMapping
@@ -39,12 +38,17 @@ from .internals import (
     warnings,
 )
 
-try:
-    from IPython import get_ipython
-except ImportError:
 
-    def get_ipython():
+def get_ipython():
+    """
+    Return the running IPython shell or ``None``.
+    """
+    # NOTE: Importing IPython is slow and an IPython session can only be running
+    # if the module was already imported, so only check the existing module.
+    module = sys.modules.get("IPython", None)
+    if module is None:
         return
+    return module.get_ipython()
 
 
 # Suppress warnings emitted by mathtext.py (_mathtext.py in recent versions)
@@ -240,6 +244,19 @@ def _filter_style_dict(rcdict, warn=True):
     return rcdict_filtered
 
 
+def _copy_rc_dict(rcdict):
+    """
+    Return a plain dictionary copy of the validated settings with list values
+    copied so that in-place modifications are not shared.
+    """
+    # NOTE: Use dict.items() to bypass validation and deprecation handling. Avoid
+    # deepcopy because it would copy e.g. the matplotlib auto backend sentinel.
+    return {
+        key: value.copy() if isinstance(value, list) else value
+        for key, value in dict.items(rcdict)
+    }
+
+
 def _get_default_style_dict():
     """
     Get the default rc parameters dictionary with deprecated parameters filtered.
@@ -271,7 +288,8 @@ def _get_style_dict(style, filter=True):
     """
     # NOTE: This is adapted from matplotlib source for the following changes:
     # 1. Add an 'original' pseudo style. Like rcParamsOrig except we also reload
-    #    from the user matplotlibrc file.
+    #    from the user matplotlibrc file. Note Configurator caches the defaults on
+    #    the first reset, so later matplotlibrc edits require a new session.
     # 2. When the style is changed we reset to the default state ignoring matplotlibrc.
     #    By contrast matplotlib applies styles on top of current state (including
     #    matplotlibrc changes and runtime rcParams changes) but the word 'style'
@@ -766,6 +784,7 @@ class Configurator(MutableMapping, dict):
         %(rc.params)s
         """
         self._context = []
+        self._defaults = {}  # cached default settings
         self._init(local=local, user=user, default=default, **kwargs)
 
     def __getitem__(self, key):
@@ -855,16 +874,38 @@ class Configurator(MutableMapping, dict):
 
         # Update from default settings
         # NOTE: see _remove_blacklisted_style_params bugfix
-        if default:
-            rc_matplotlib.update(_get_style_dict("original", filter=False))
+        # NOTE: The validated and synced default settings are cached after the first
+        # call. Later resets restore copies of these settings without validation
+        # (similar to matplotlib's rc_context) rather than reading matplotlibrc from
+        # disk and re-syncing every setting. User and local files are still reloaded.
+        # Only the matplotlib keys set below are cached so that e.g. the backend
+        # selected with matplotlib.use() is not restored. Only side-effect-free
+        # settings can be restored from the cache, so _get_item_dicts() side effects
+        # (currently just the inline backend configuration) are re-applied here.
+        cache = self._defaults.get(skip_cycle) if default else None
+        if cache is not None:
+            dict.update(rc_matplotlib, _copy_rc_dict(cache[0]))
+            dict.update(rc_ultraplot, _copy_rc_dict(cache[1]))
+            if get_ipython() is not None:
+                config_inline_backend(rc_ultraplot["inlineformat"])
+        elif default:
+            kw_style = _get_style_dict("original", filter=False)
+            rc_matplotlib.update(kw_style)
             rc_matplotlib.update(rcsetup._rc_matplotlib_default)
             rc_ultraplot.update(rcsetup._rc_ultraplot_default)
+            keys = {*kw_style, *rcsetup._rc_matplotlib_default}
             for key, value in rc_ultraplot.items():
                 kw_ultraplot, kw_matplotlib = self._get_item_dicts(
                     key, value, skip_cycle=skip_cycle
                 )
                 rc_matplotlib.update(kw_matplotlib)
                 rc_ultraplot.update(kw_ultraplot)
+                keys.update(kw_matplotlib)
+            kw_matplotlib = {key: dict.__getitem__(rc_matplotlib, key) for key in keys}
+            self._defaults[skip_cycle] = (
+                _copy_rc_dict(kw_matplotlib),
+                _copy_rc_dict(rc_ultraplot),
+            )
 
         # Update from user home
         user_path = None
@@ -1494,14 +1535,17 @@ class Configurator(MutableMapping, dict):
                 + ", ".join(map(repr, rcsetup._rc_categories))
                 + "."
             )
+        # NOTE: This is called for every axes in every format() call so use string
+        # methods rather than matching a regular expression against every setting.
+        prefix = cat + "."
         for key in self:
-            if not re.match(rf"\A{cat}\.[^.]+\Z", key):
+            if not key.startswith(prefix) or "." in key[len(prefix) :]:
                 continue
             value = self._get_item_context(key, None if context else 0)
             if value is None:
                 continue
             if trimcat:
-                key = re.sub(rf"\A{cat}\.", "", key)
+                key = key[len(prefix) :]
             kw[key] = value
         return kw
 
@@ -173,6 +173,9 @@ if _version_cartopy >= "0.18":
     FORMATTERS["dmslon"] = partial(pticker.LongitudeFormatter, dms=True)
     FORMATTERS["dmslat"] = partial(pticker.LatitudeFormatter, dms=True)
 
+# Formatter string patterns
+REGEX_FORMAT = re.compile(r"{x(:.+)?}")  # str.format() style
+
 # Scale registry and presets
 SCALES = mscale._scale_mapping
 SCALES_PRESETS = {
@@ -1264,7 +1267,7 @@ def Formatter(formatter, *args, date=False, index=False, **kwargs):
     if isinstance(formatter, mticker.Formatter):
         return copy.copy(formatter)
     if isinstance(formatter, str):
-        if re.search(r"{x(:.+)?}", formatter):  # str.format
+        if REGEX_FORMAT.search(formatter):  # str.format
             formatter = mticker.StrMethodFormatter(formatter, *args, **kwargs)
         elif "%" in formatter:  # str % format
             cls = mdates.DateFormatter if date else mticker.FormatStrFormatter
@@ -1210,7 +1210,7 @@ class Figure(mfigure.Figure):
         # NOTE: Permit figure format keywords for e.g. 'collabels' (more intuitive)
         nums = np.unique(array[array != 0])
         naxs = len(nums)
-        if any(num < 0 or not isinstance(num, Integral) for num in nums.flat):
+        if np.any(nums < 0):  # integer dtype ensured above
             raise ValueError(f"Expected array of positive integers. Got {array}.")
         proj = _not_none(projection=projection, proj=proj)
         proj = _axes_dict(naxs, proj, kw=False, default="cartesian")
@@ -1240,10 +1240,16 @@ class Figure(mfigure.Figure):
             gs = pgridspec.GridSpec(*array.shape, **gridspec_kw)
         else:
             gs.update(**gridspec_kw)
+        # NOTE: Get the row and column spans of every subplot number with ufunc.at()
+        # reductions over the nonzero cells rather than one array search per number.
         axs = naxs * [None]  # list of axes
-        axids = [np.where(array == i) for i in np.sort(np.unique(array)) if i > 0]
-        axcols = np.array([[x.min(), x.max()] for _, x in axids])
-        axrows = np.array([[y.min(), y.max()] for y, _ in axids])
+        rows, cols = np.nonzero(array)
+        _, idxs = np.unique(array[rows, cols], return_inverse=True)
+        axrows = np.tile([array.shape[0], 0], (naxs, 1))
+        axcols = np.tile([array.shape[1], 0], (naxs, 1))
+        for spans, locs in ((axrows, rows), (axcols, cols)):
+            np.minimum.at(spans[:, 0], idxs, locs)
+            np.maximum.at(spans[:, 1], idxs, locs)
         for idx in range(naxs):
             num = idx + 1
             x0, x1 = axcols[idx, 0], axcols[idx, 1]
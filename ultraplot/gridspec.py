@@ -734,10 +734,13 @@ class GridSpec(mgridspec.GridSpec):
             pad = self.hpad_total
 
         # Iterate along each row or column space
+        # NOTE: Pack the cached tight bounding box spans into a single array so
+        # that group margins are array reductions rather than python loops.
         axs = tuple(fig._iter_axes(hidden=True, children=False))
         space = list(space)  # a copy
         ralong = np.array([ax._range_subplotspec(x) for ax in axs])
         racross = np.array([ax._range_subplotspec(y) for ax in axs])
+        rtight = np.array([ax._range_tightbbox(x) for ax in axs], dtype=float)
         for i, (s, p) in enumerate(zip(space, pad)):
             # Find axes that abutt aginst this row or column space
             groups = []
@@ -745,7 +748,7 @@ class GridSpec(mgridspec.GridSpec):
                 # Get the indices for axes that meet this row or column edge.
                 # NOTE: Rigorously account for empty and overlapping slots here
                 filt = (racross[:, 0] <= j) & (j <= racross[:, 1])
-                if sum(filt) < 2:
+                if np.count_nonzero(filt) < 2:
                     continue  # no interface
                 ii = i
                 idx1 = idx2 = np.array(())
@@ -759,17 +762,17 @@ class GridSpec(mgridspec.GridSpec):
                     (idx2,) = np.where(filt & filt2)
                     ii += 1
                 # Put axes into unique groups and store as (l, r) or (b, t) pairs.
-                axs1, axs2 = [axs[_] for _ in idx1], [axs[_] for _ in idx2]
+                idx1, idx2 = idx1.tolist(), idx2.tolist()
                 if x != "x":  # order bottom-to-top
-                    axs1, axs2 = axs2, axs1
+                    idx1, idx2 = idx2, idx1
                 for group1, group2 in groups:
-                    if any(_ in group1 for _ in axs1) or any(_ in group2 for _ in axs2):
-                        group1.update(axs1)
-                        group2.update(axs2)
+                    if not group1.isdisjoint(idx1) or not group2.isdisjoint(idx2):
+                        group1.update(idx1)
+                        group2.update(idx2)
                         break
                 else:
-                    if axs1 and axs2:
-                        groups.append((set(axs1), set(axs2)))  # form new group
+                    if idx1 and idx2:
+                        groups.append((set(idx1), set(idx2)))  # form new group
             # Determing the spaces using cached tight bounding boxes
             # NOTE: Set gridspec space to zero if there are no adjacent edges
             if not group:
@@ -781,10 +784,10 @@ class GridSpec(mgridspec.GridSpec):
                 ]
             margins = []
             for group1, group2 in groups:
-                x1 = max(ax._range_tightbbox(x)[1] for ax in group1)
-                x2 = min(ax._range_tightbbox(x)[0] for ax in group2)
+                x1 = np.fmax.reduce(rtight[list(group1), 1], initial=np.nan)
+                x2 = np.fmin.reduce(rtight[list(group2), 0], initial=np.nan)
                 margins.append((x2 - x1) / self.figure.dpi)
-            s = 0 if not margins else max(0, s - min(margins) + p)
+            s = 0 if not margins else max(0, s - np.fmin.reduce(margins) + p)
             space[i] = s
 
         return space
@@ -1496,14 +1499,12 @@ class SubplotGrid(MutableSequence, list):
                 ss_key = gs._make_subplot_spec(key)  # obfuscates panels
                 row1_key, col1_key = divmod(ss_key.num1, gs.ncols)
                 row2_key, col2_key = divmod(ss_key.num2, gs.ncols)
-            for ax in self:
-                ss = ax._get_topmost_axes().get_subplotspec().get_topmost_subplotspec()
-                row1, col1 = divmod(ss.num1, gs.ncols)
-                row2, col2 = divmod(ss.num2, gs.ncols)
-                inrow = row1_key <= row1 <= row2_key or row1_key <= row2 <= row2_key
-                incol = col1_key <= col1 <= col2_key or col1_key <= col2 <= col2_key
-                if inrow and incol:
-                    objs.append(ax)
+                (row1, row2), (col1, col2) = self._get_extents()
+                inrow = (row1_key <= row1) & (row1 <= row2_key)
+                inrow |= (row1_key <= row2) & (row2 <= row2_key)
+                incol = (col1_key <= col1) & (col1 <= col2_key)
+                incol |= (col1_key <= col2) & (col2 <= col2_key)
+                objs = [ax for ax, mask in zip(self, inrow & incol) if mask]
             if not slices and len(objs) == 1:  # accounts for overlapping subplots
                 objs = objs[0]
         else:
@@ -1565,6 +1566,19 @@ class SubplotGrid(MutableSequence, list):
         _grid_command.__doc__ = doc
         setattr(cls, name, _grid_command)
 
+    def _get_extents(self):
+        """
+        Return the gridspec row and column extents of the subplots in the grid.
+        """
+        # NOTE: Returns (2, N) arrays of the (start, stop) rows and columns so that
+        # 2D indexing can select subplots with a single vectorized mask.
+        nums = []
+        for ax in self:
+            ss = ax._get_topmost_axes().get_subplotspec().get_topmost_subplotspec()
+            nums.append((ss.num1, ss.num2))
+        nums = np.array(nums, dtype=int).reshape((-1, 2)).T
+        return np.divmod(nums, self.gridspec.ncols)
+
     def _validate_item(self, items, scalar=False):
         """
         Validate assignments. Accept diverse iterable inputs.
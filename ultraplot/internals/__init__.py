@@ -385,14 +385,9 @@ def _pop_props(input, *categories, prefix=None, ignore=None, skip=None):
     return output
 
 
-def _pop_rc(src, *, ignore_conflicts=True):
-    """
-    Pop the rc setting names and mode for a `~Configurator.context` block.
-    """
-    # NOTE: Must ignore deprected or conflicting rc params
-    # NOTE: rc_mode == 2 applies only the updated params. A power user
-    # could use ax.format(rc_mode=0) to re-apply all the current settings
-    conflict_params = (
+# Deprecated or conflicting rc setting names ignored by _pop_rc()
+_rc_conflicts = frozenset(
+    (
         "alpha",
         "color",
         "facecolor",
@@ -403,8 +398,17 @@ def _pop_rc(src, *, ignore_conflicts=True):
         "share",
         "span",
         "tight",
-        "span",
     )
+)
+
+
+def _pop_rc(src, *, ignore_conflicts=True):
+    """
+    Pop the rc setting names and mode for a `~Configurator.context` block.
+    """
+    # NOTE: Must ignore deprected or conflicting rc params (see _rc_conflicts)
+    # NOTE: rc_mode == 2 applies only the updated params. A power user
+    # could use ax.format(rc_mode=0) to re-apply all the current settings
     kw = src.pop("rc_kw", None) or {}
     if "mode" in src:
         src["rc_mode"] = src.pop("mode")
@@ -415,7 +419,7 @@ def _pop_rc(src, *, ignore_conflicts=True):
     mode = _not_none(mode, 2)  # only apply updated params by default
     for key, value in tuple(src.items()):
         name = rcsetup._rc_nodots.get(key, None)
-        if ignore_conflicts and name in conflict_params:
+        if ignore_conflicts and name in _rc_conflicts:
             name = None  # former renamed settings
         if name is not None:
             kw[name] = src.pop(key)
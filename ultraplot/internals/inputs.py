@@ -109,7 +109,9 @@ def _is_descending(data):
     if data.ndim > 1 or data.size < 2:
         return False
     try:
-        return all(x != abs(x) for x in np.diff(data))
+        diff = np.diff(data)
+        mask = ma.filled(diff != np.abs(diff), False)  # masked values are not negative
+        return bool(np.all(mask))  # vectorized negative test
     except TypeError:
         return False
 
@@ -635,7 +637,8 @@ def _meta_coords(*args, which="x", **kwargs):
     # depend on other plotted content.
     # NOTE: Why IndexFormatter and not FixedFormatter? The former ensures labels
     # correspond to indices while the latter can mysteriously truncate labels.
-    from ..constructor import Formatter, Locator
+    from ..constructor import Locator
+    from ..ticker import IndexFormatter
 
     res = []
     for data in args:
@@ -646,9 +649,9 @@ def _meta_coords(*args, which="x", **kwargs):
         if data.ndim > 1:
             raise ValueError("Non-1D string coordinate input is unsupported.")
         ticks = np.arange(len(data))
-        labels = list(map(str, data))
+        labels = _to_numpy_array(data)  # stringified lazily by the formatter
         kwargs.setdefault(which + "locator", Locator(ticks))
-        kwargs.setdefault(which + "formatter", Formatter(labels, index=True))
+        kwargs.setdefault(which + "formatter", IndexFormatter(labels))
         kwargs.setdefault(which + "minorlocator", Locator("null"))
         res.append(ticks)  # use these as data coordinates
     return (*res, kwargs)
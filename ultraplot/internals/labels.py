@@ -83,3 +83,19 @@ def _update_label(text, props=None, **kwargs):
             "pad": bboxpad,
         }
     return mtext.Text.update(text, props)
+
+
+def _update_ticklabels(axis, props=None, **kwargs):
+    """
+    Update the major tick label properties without materializing the ticks. Unlike
+    ``axis.get_ticklabels()`` this does not run the locator and formatter.
+    """
+    # NOTE: Matplotlib creates new ticks by copying properties from the first
+    # tick in the list (see Axis._copy_tick_props), so updating the existing
+    # ticks is sufficient. Accessing the lazy tick list allocates at most one tick.
+    props = props or {}
+    props = props.copy()  # shallow copy
+    props.update(kwargs)
+    for tick in axis.majorTicks:
+        tick.label1.update(props)
+        tick.label2.update(props)
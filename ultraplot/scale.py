@@ -858,17 +858,18 @@ class CutoffTransform(mtransforms.Transform):
         return CutoffTransform(threshs, scales, zero_dists=zero_dists)
 
     def transform_non_affine(self, a):
-        # Cannot do list comprehension because this method sometimes
-        # received non-1D arrays
-        dists = self._dists
+        # NOTE: Find the segment for every element in one searchsorted call and
+        # offset by the cumulative distances rather than looping over elements.
+        # This method sometimes receives non-1D arrays so we operate on the copy.
+        dists = np.cumsum(self._dists)
         scales = self._scales
         threshs = self._threshs
         aa = np.array(a)  # copy
+        j = np.searchsorted(threshs, aa)
+        mask = j > 0
+        j = j[mask] - 1
         with np.errstate(divide="ignore", invalid="ignore"):
-            for i, ai in np.ndenumerate(a):
-                j = np.searchsorted(threshs, ai)
-                if j > 0:
-                    aa[i] = dists[:j].sum() + (ai - threshs[j - 1]) / scales[j - 1]
+            aa[mask] = dists[j] + (aa[mask] - threshs[j]) / scales[j]
         return aa
 
 
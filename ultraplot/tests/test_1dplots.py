@@ -4,6 +4,7 @@ Test 1D plotting overrides.
 """
 import numpy as np
 import numpy.ma as ma
+import matplotlib.collections as mcollections
 import pandas as pd
 
 import ultraplot as uplt
@@ -523,3 +524,79 @@ def test_heatmap_labels():
     fig, ax = uplt.subplots()
     ax.heatmap(x, labels=True)
     return fig
+
+
+def test_plot_collection():
+    """
+    Test drawing the columns of a 2D array as a single line collection.
+    """
+    data = (state.rand(50, 5) - 0.5).cumsum(axis=0)
+    fig, axs = uplt.subplots(ncols=2)
+    lines = axs[0].plot(data, cycle="Grays", lw=2)
+    (coll,) = axs[1].plot(data, cycle="Grays", lw=2, collection=True)
+    assert isinstance(coll, mcollections.LineCollection)
+    assert not axs[1].lines and len(coll.get_segments()) == 5
+    colors = [uplt.colors.to_rgba(line.get_color()) for line in lines]
+    assert np.allclose(coll.get_colors(), colors)
+    assert np.allclose(coll.get_linewidths(), 2)
+    fig.canvas.draw()
+    assert np.allclose(axs[0].get_xlim(), axs[1].get_xlim())
+
+
+@pytest.mark.parametrize("collection", [False, True])
+def test_plot_inbounds(collection):
+    """
+    Test in-bounds y limits for line plots with fixed x limits.
+    """
+    x = np.linspace(0, 100, 101)
+    fig, ax = uplt.subplots()
+    ax.format(xlim=(0, 10))
+    ax.plot(x, np.column_stack((x, 2 * x)), collection=collection)
+    fig.canvas.draw()
+    assert np.allclose(ax.get_ylim(), (-1, 21))
+
+
+def test_plot_collection_invalid():
+    """
+    Test unsupported properties, guides, and axes for line collections.
+    """
+    data = state.rand(10, 3)
+    fig, axs = uplt.subplots(ncols=2, proj=("cart", "polar"))
+    cycle = uplt.Cycle("r", "g", "b", marker=["o", "x", "s"])
+    for kw in (
+        {"marker": "o"},
+        {"colorbar": "r", "cycle": "viridis"},
+        {"cycle": cycle},
+    ):
+        with pytest.raises(ValueError):
+            axs[0].plot(data, collection=True, **kw)
+    with pytest.raises(ValueError):
+        axs[0].plot(data, "k-", collection=True)
+    with pytest.raises(ValueError):
+        axs[1].plot(data, collection=True)
+
+
+def test_plot_collection_datetime():
+    """
+    Test datetime coordinates for line collections.
+    """
+    x = pd.date_range("2020-01-01", periods=20)
+    data = state.rand(20, 3).cumsum(axis=0)
+    fig, axs = uplt.subplots(ncols=2)
+    axs[0].plot(x, data)
+    (coll,) = axs[1].plot(x, data, collection=True)
+    assert isinstance(coll, mcollections.LineCollection)
+    fig.canvas.draw()
+    assert np.allclose(axs[0].get_xlim(), axs[1].get_xlim())
+    assert np.allclose(axs[0].get_ylim(), axs[1].get_ylim())
+
+
+def test_auto_reverse_masked():
+    """
+    Test that masked descending coordinates do not trigger auto reverse.
+    """
+    fig, axs = uplt.subplots(ncols=2)
+    y = np.arange(4)
+    axs[0].plot(np.array([3, 2, 1, 0]), y)
+    axs[1].plot(ma.masked_invalid([3, 2, np.nan, 0]), y)
+    assert axs[0].xaxis_inverted() and not axs[1].xaxis_inverted()
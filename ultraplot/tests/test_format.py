@@ -395,3 +395,85 @@ def test_input_parsing_cycle():
     last_color = uplt.colors.to_rgba(cycle.get_next()["color"])
     assert np.allclose(first_color, lower_half(0.0))
     assert np.allclose(last_color, upper_half(1.0))
+
+
+def test_format_lazy_ticks():
+    """
+    Test that tick label settings do not materialize ticks before drawing.
+    """
+    fig, ax = uplt.subplots()
+    nticks = len(ax.xaxis.majorTicks)
+    ax.format(xlim=(0, 100), xlocator=10, ticklabelweight="bold", xrotation=45)
+    assert len(ax.xaxis.majorTicks) == nticks
+    fig.canvas.draw()
+    labels = [label for label in ax.xaxis.get_ticklabels() if label.get_text()]
+    assert labels
+    assert all(label.get_fontweight() == "bold" for label in labels)
+    assert all(label.get_rotation() == 45 for label in labels)
+
+
+def test_format_categorical_labels():
+    """
+    Test that categorical coordinates are labeled lazily by the index formatter.
+    """
+    fig, ax = uplt.subplots()
+    data = np.array(["a", 2, "c"], dtype=object)
+    ax.plot(data, [1, 2, 3])
+    formatter = ax.xaxis.get_major_formatter()
+    assert isinstance(formatter, uplt.ticker.IndexFormatter)
+    assert formatter.format_ticks([0, 1, 2, 3]) == ["a", "2", "c", ""]
+
+
+def test_rc_reset():
+    """
+    Test that resetting restores the cached default settings.
+    """
+    uplt.rc.reset()
+    fontsize, ticklen = uplt.rc["font.size"], uplt.rc["xtick.minor.size"]
+    fonts = list(uplt.rc["font.sans-serif"])
+    uplt.rc.update({"font.size": 20, "tick.len": 10})
+    uplt.rc["font.sans-serif"].insert(0, "Foo")
+    uplt.rc.reset()
+    uplt.rc["font.sans-serif"].insert(0, "Foo")  # must not modify the cache
+    uplt.rc.reset()
+    assert uplt.rc["font.size"] == fontsize
+    assert uplt.rc["xtick.minor.size"] == ticklen
+    assert uplt.rc["font.sans-serif"] == fonts
+
+
+def test_rc_reset_backend():
+    """
+    Test that resetting does not restore the backend selected at import time.
+    """
+    import matplotlib as mpl
+
+    backend = mpl.get_backend()
+    try:
+        mpl.use("pdf")
+        uplt.rc.reset()
+        assert mpl.rcParams["backend"] == "pdf"
+    finally:
+        mpl.use(backend)
+
+
+def test_rc_reset_inline_backend(monkeypatch):
+    """
+    Test that resetting re-applies the inline backend format.
+    """
+    import ultraplot.config as pconfig
+
+    class _Shell:
+        magics = []
+
+        def run_line_magic(self, name, line):
+            self.magics.append(line)
+
+    shell = _Shell()
+    monkeypatch.setattr(pconfig, "get_ipython", lambda: shell)
+    default = uplt.rc["inlineformat"]
+    uplt.rc.inlineformat = "png"
+    assert "InlineBackend.figure_formats = ['png']" in shell.magics
+    idx = len(shell.magics)
+    uplt.rc.reset()
+    assert uplt.rc["inlineformat"] == default
+    assert f"InlineBackend.figure_formats = {[default]!r}" in shell.magics[idx:]
@@ -644,16 +644,31 @@ class IndexFormatter(mticker.Formatter):
 
     # NOTE: This was deprecated in matplotlib 3.3. For details check out
     # https://github.com/matplotlib/matplotlib/issues/16631 and bring some popcorn.
+    # NOTE: Labels are converted to strings only when requested by the tick
+    # formatting machinery. This avoids stringifying every coordinate of long
+    # categorical inputs when only a handful of positions are ever ticked.
     def __init__(self, labels):
         self.labels = labels
         self.n = len(labels)
+        self._cache = {}
 
-    def __call__(self, x, pos=None):  # noqa: U100
-        i = int(round(x))
+    def _format_index(self, i):
         if i < 0 or i >= self.n:
             return ""
-        else:
-            return self.labels[i]
+        label = self._cache.get(i)
+        if label is None:
+            label = self._cache[i] = str(self.labels[i])
+        return label
+
+    def __call__(self, x, pos=None):  # noqa: U100
+        return self._format_index(int(round(x)))
+
+    def format_ticks(self, values):
+        # NOTE: Round the tick values in a single vectorized pass rather than
+        # dispatching to __call__ once per tick. Both use round-half-to-even.
+        self.set_locs(values)
+        idxs = np.round(np.asarray(values, dtype=float)).astype(int)
+        return [self._format_index(i) for i in idxs.ravel().tolist()]
 
 
 class SciFormatter(mticker.Formatter):